@@ -1,14 +1,14 @@
 """TODO: Docstring"""
 from dataclasses import dataclass
 
-@dataclass     
+@dataclass(slots=True)
 class ParagraphFlags():
      remove_title_page:         bool = True
      remove_headings:           bool = True
      remove_bibliography:       bool = True
      remove_tables_and_figures: bool = True
 
-@dataclass
+@dataclass(slots=True)
 class TextFlags():
     remove_stop_words:      bool = True
     remove_punctuation:     bool = True
@@ -20,7 +20,7 @@ class CorporaGenerationFlags():
     #log_level: LogLevel TODO: Create LogLevel enum to be able to 
     create_preview: bool = False
 
-@dataclass
+@dataclass(slots=True)
 class FlagContainer():
     paragraph_flags:    ParagraphFlags
     text_flags:         TextFlags
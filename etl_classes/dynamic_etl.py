@@ -1,10 +1,85 @@
+from collections.abc import Iterator
+from dataclasses import asdict
 from docx import Document
-import jsonpickle
+import functools
+import json
+import multiprocessing
+import os
 from data_classes.flag import FlagContainer, TextFlags, ParagraphFlags
+from data_classes.paragraph import Paragraph, ParagraphStyle
 from modifiers.paragraph_modifier import ParagraphModifier
 from modifiers.text_modifier import TextModifier
 from .base_etl_class import BaseETL
-from json import loads
+
+try:
+    import orjson
+except ImportError:  # orjson is optional, fall back to the (slower) standard library json module
+    orjson = None
+
+@functools.lru_cache(maxsize=1)
+def _load_stopwords() -> frozenset[str]:
+    """
+    Loads the Dutch stop words once and caches them for subsequent calls.
+
+    Returns:
+        frozenset[str]: The stop words, as a frozenset for constant time lookups.
+    """
+    with open('stopwords.json', 'r') as file:
+        return frozenset(json.load(file))
+
+def _dumps(obj) -> bytes:
+    """
+    Serializes an object to JSON bytes, using orjson when it is available.
+
+    Args:
+        obj: The object to serialize.
+
+    Returns:
+        bytes: The serialized object.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj).encode()
+
+def _parse_docx(path: str) -> tuple[list[tuple[str, str]], str]:
+    """
+    Parses a single DOCX file, keeping only the text and style name of each paragraph.
+
+    Args:
+        path (str): The path to the DOCX file.
+
+    Returns:
+        tuple: A tuple containing a list of (text, style name) tuples and the filename.
+    """
+    filename = os.path.basename(path)
+    paragraphs_data = [(paragraph.text, paragraph.style.name) for paragraph in Document(path).paragraphs]
+    return paragraphs_data, filename
+
+def _process_one_doc(args: tuple) -> dict:
+    """
+    Parses and processes a single document inside a worker process.
+
+    Args:
+        args (tuple): A tuple of (path, text_flags, paragraph_flags, stopwords).
+
+    Returns:
+        dict: The transformed document containing the filename and its corpora.
+    """
+    path, text_flags, paragraph_flags, stopwords = args
+    # The document is parsed in the worker, so the parent never holds the parsed paragraphs
+    paragraphs_data, filename = _parse_docx(path)
+    print(f"[EXTRACT] Extracted docx file '{filename}'")
+    # A document only uses a handful of styles, so paragraphs with the same style share one ParagraphStyle (and name)
+    paragraph_styles = {style: ParagraphStyle(style) for style in {name for _, name in paragraphs_data}}
+    doc_paragraphs = [Paragraph(text, paragraph_styles[style]) for text, style in paragraphs_data]
+
+    kept_paragraphs, _ = DynamicETL._remove_paragraphs_from_doc(doc_paragraphs, paragraph_flags)
+    current_doc_obj = {
+        "filename": filename,
+        "corpora": DynamicETL._transform_paragraphs_from_doc(kept_paragraphs, text_flags, stopwords)
+    }
+    print(f"[TRANSFORM] Transformed docx file '{filename}'")
+    return current_doc_obj
 
 class DynamicETL(BaseETL):
     """
@@ -37,36 +112,87 @@ class DynamicETL(BaseETL):
         transformed_data = self._transform(extracted_data, flags)
         self._load(dest_dir, transformed_data)
 
-    def _transform(self, data: list[Document], flags: FlagContainer):
+    def _extract(self, data_dir: str) -> Iterator[str]:
+        """
+        Lazily collects the paths of the DOCX files in the specified directory.
+        The files themselves are parsed by the transform workers, so each document is only held by the worker processing it.
+
+        Args:
+            data_dir (str): The directory containing the input DOCX files.
+
+        Yields:
+            str: The path to a DOCX file.
+        """
+        for filename in os.listdir(data_dir):
+            if filename.endswith('.docx'):
+                yield f"{data_dir}/{filename}"
+
+    def _transform(self, data: Iterator[str], flags: FlagContainer):
         """
         Transforms the extracted data according to the specified flags.
 
         Args:
-            data (list[Document]): The extracted data as a list of Document objects.
+            data (Iterator[str]): The paths to the DOCX files.
             flags (FlagContainer): The flags specifying the transformation operations.
 
         Returns:
-            dict: The transformed data as a dictionary.
+            dict: The transformed data as a dictionary. The documents are a lazy iterator, which is consumed by `_load`.
 
         """
+        # Resolved before `_load` runs, so configuration errors are raised before any output is written
+        worker_count = self._get_worker_count()
+
         corpora_total = {}
-        corpora_total["config"] = flags.__dict__
-        corpora_total["documents"] = []
+        corpora_total["config"] = asdict(flags)
+        corpora_total["documents"] = self.__transform_documents(data, flags, worker_count)
+        return corpora_total
+
+    def __transform_documents(self, data: Iterator[str], flags: FlagContainer, worker_count: int) -> Iterator[dict]:
+        """
+        Parses and transforms the documents in parallel, yielding every document as soon as it is transformed.
+
+        Args:
+            data (Iterator[str]): The paths to the DOCX files.
+            flags (FlagContainer): The flags specifying the transformation operations.
+            worker_count (int): The amount of worker processes.
+
+        Yields:
+            dict: The transformed document containing the filename and its corpora.
+        """
         text_flags = flags.text_flags
         paragraph_flags = flags.paragraph_flags
 
-        removed_paragraphs = []  # TODO: Implement paragraphs
-        for current_doc, filename in data:
-            current_doc_obj = {"filename": filename}
-            current_doc_corpora: list[dict] = []
-            kept_paragraphs, _ = self.__remove_paragraphs_from_doc(current_doc.paragraphs, paragraph_flags)
-            current_doc_corpora.extend(self.__transform_paragraphs_from_doc(kept_paragraphs, text_flags))
-            current_doc_obj["corpora"] = current_doc_corpora
-            corpora_total["documents"].append(current_doc_obj)
+        # prepare stop_words once, so that workers do not have to read the file themselves
+        stopwords = _load_stopwords() if text_flags.remove_stop_words else frozenset()
 
-        return corpora_total
+        # Only the file paths are sent to the workers, every document is parsed and transformed by a single worker
+        tasks = ((path, text_flags, paragraph_flags, stopwords) for path in data)
+
+        with multiprocessing.Pool(worker_count) as pool:
+            yield from pool.imap(_process_one_doc, tasks)
+
+    @staticmethod
+    def _get_worker_count() -> int:
+        """
+        Determines the amount of worker processes used for transforming documents.
+        Can be overridden with the `ETL_WORKERS` environment variable.
+
+        Returns:
+            int: The amount of worker processes, at least 1.
 
-    def __remove_paragraphs_from_doc(self, doc_paragraphs, paragraph_flags: ParagraphFlags) -> tuple:
+        Raises:
+            ValueError: If `ETL_WORKERS` is not an integer.
+        """
+        workers = os.environ.get("ETL_WORKERS")
+        if workers is None:
+            return max((os.cpu_count() or 1) - 1, 1)
+        try:
+            return max(int(workers), 1)
+        except ValueError:
+            raise ValueError(f"ETL_WORKERS must be an integer, got '{workers}'") from None
+
+    @staticmethod
+    def _remove_paragraphs_from_doc(doc_paragraphs, paragraph_flags: ParagraphFlags) -> tuple:
         """
         Removes paragraphs from a document based on the specified paragraph flags.
 
@@ -80,13 +206,11 @@ class DynamicETL(BaseETL):
         """
         removed_paragraphs = []
         if paragraph_flags.remove_title_page:
-            print("removing titlepage")
             corpora_with_headings_removed, removed_headings = ParagraphModifier.remove_title(doc_paragraphs)
             doc_paragraphs = corpora_with_headings_removed
             removed_paragraphs.extend(removed_headings)
 
         if paragraph_flags.remove_bibliography:
-            print("removing bib")
             corpora_with_headings_removed, removed_headings = ParagraphModifier.remove_bibliography(doc_paragraphs)
             doc_paragraphs = corpora_with_headings_removed
             removed_paragraphs.extend(removed_headings)
@@ -103,58 +227,51 @@ class DynamicETL(BaseETL):
 
         return doc_paragraphs, removed_paragraphs
 
-    def __transform_paragraphs_from_doc(self, doc_paragraphs, text_flags: TextFlags) -> list[dict]:
+    @staticmethod
+    def _transform_paragraphs_from_doc(doc_paragraphs, text_flags: TextFlags, stopwords) -> list[dict]:
         """
         Transforms the paragraphs from a document based on the specified text flags.
 
         Args:
             doc_paragraphs: The paragraphs in the document.
             text_flags (TextFlags): The flags specifying the text transformation operations.
+            stopwords (frozenset[str]): The stop words to be removed.
 
         Returns:
             list[dict]: The transformed paragraphs as a list of dictionaries.
 
         """
-        total_doc_corpora = []
-        # prepare stop_words if necessary
+        # The flags are fixed for the whole document, so build the list of active transformations once.
+        # Every transformation is applied to all texts of the document at once, which allows batching (e.g: lemmatization).
+        text_pipeline = []
         if text_flags.remove_stop_words:
-            with open('stopwords.json', 'r') as file:
-                stopwords = loads(file.read())  # list of Dutch stopwords
-
-        for paragraph in doc_paragraphs:
-            # Remove empty paragraphs
-            if paragraph.text == "" or paragraph.text == " " or paragraph.text == "\n":
-                continue
-
-            # Remove paragraphs containing only 1 or 2 words
-            if len(paragraph.text.split()) < 3:
-                continue
-
-            current_paragraph_obj = {"text": paragraph.text.strip(), "style": paragraph.style.name}  # TODO: use Paragraph class from data_classes -> paragraph.py
-            # For each paragraph, check the flag dictionary
-            if text_flags.remove_stop_words:
-                print("removing stop words")
-                current_paragraph_obj["text"] = TextModifier.remove_stop_words(current_paragraph_obj["text"], stopwords)
-
-            if text_flags.apply_lemmatization:
-                print("applying lemmatization")
-                current_paragraph_obj["text"] = TextModifier.apply_lemmatization(current_paragraph_obj["text"])
+            text_pipeline.append(lambda texts: [TextModifier.remove_stop_words(text, stopwords) for text in texts])
+        if text_flags.apply_lemmatization:
+            text_pipeline.append(TextModifier.apply_lemmatization_batch)
+        if text_flags.apply_stemming:
+            text_pipeline.append(lambda texts: [TextModifier.apply_stemming(text) for text in texts])
+        if text_flags.remove_punctuation:
+            text_pipeline.append(lambda texts: [TextModifier.remove_punctuation(text) for text in texts])
 
-            if text_flags.apply_stemming:
-                print("applying stemming")
-                current_paragraph_obj["text"] = TextModifier.apply_stemming(current_paragraph_obj["text"])
+        # Texts and styles are processed as separate columns, records are only created for the output
+        texts = [paragraph.text for paragraph in doc_paragraphs]
+        styles = [paragraph.style.name for paragraph in doc_paragraphs]
 
-            if text_flags.remove_punctuation:
-                print("removing punctuation")
-                current_paragraph_obj["text"] = TextModifier.remove_punctuation(current_paragraph_obj["text"])
+        # Remove paragraphs containing less than 3 words, empty and whitespace only paragraphs split into no words at all
+        mask = [len(text.split()) >= 3 for text in texts]
+        texts = [text.strip() for text, keep in zip(texts, mask) if keep]
+        styles = [style for style, keep in zip(styles, mask) if keep]
 
-            total_doc_corpora.append(current_paragraph_obj)
+        for transformation in text_pipeline:
+            texts = transformation(texts)
 
-        return total_doc_corpora
+        return [{"text": text, "style": style} for text, style in zip(texts, styles)]
 
     def _load(self, dest_str: str, data):
         """
         Loads the transformed data to the specified destination.
+        Documents are written one by one as they arrive, so the complete corpora never has to be held in memory.
+        The output is written to a temporary file first, so a failing transformation never leaves an incomplete file behind.
 
         Args:
             dest_str (str): The destination file path.
@@ -164,6 +281,17 @@ class DynamicETL(BaseETL):
             None
 
         """
-        json_str = jsonpickle.encode(data, unpicklable=False)
-        with open(dest_str, "w") as f:
-            f.write(json_str)
+        # The temporary file is placed next to the destination, so that it can be renamed atomically
+        temp_path = f"{dest_str}.tmp"
+        try:
+            with open(temp_path, "wb") as f:
+                f.write(b'{"config":' + _dumps(data["config"]) + b',"documents":[')
+                for i, document in enumerate(data["documents"]):
+                    if i > 0:
+                        f.write(b",")
+                    f.write(_dumps(document))
+                f.write(b"]}")
+            os.replace(temp_path, dest_str)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
@@ -1,6 +1,9 @@
 """TODO: Docstring"""
 import re
 
+# Matches captions of tables and figures, e.g: "Figuur 1.1: This is a figure"
+table_figure_pattern = re.compile(r"^(figuur|tabel)\s[1-9](\.([1-9]|[1-9][1-9])(:|\.)|(:|\.)).*$")
+
 class ParagraphIdentifier():
     @staticmethod
     def is_paragraph_heading(paragraph_style_name: str = None) -> bool:
@@ -35,6 +38,6 @@ class ParagraphIdentifier():
     @staticmethod 
     def is_paragraph_table_or_figure(paragraph_text: str) -> bool:
         """TODO: Docstring"""
-        if re.match("^(figuur|tabel)\s[1-9](\.([1-9]|[1-9][1-9])(:|\.)|(:|\.)).*$", paragraph_text.lower()):
+        if table_figure_pattern.match(paragraph_text.lower()):
             return True
         return False
\ No newline at end of file
@@ -1,5 +1,5 @@
-import re
 from data_classes.paragraph import Paragraph
+from modifiers.paragraph_identifier import table_figure_pattern
 
 class ParagraphModifier():
     @staticmethod
@@ -13,7 +13,6 @@ class ParagraphModifier():
         Returns:
             tuple: A tuple containing the list of kept paragraphs and the list of removed paragraphs.
         """
-        print("Removing headings")
         removed_paragraphs = []
         kept_paragraphs = []
         for paragraph in paragraph_list: 
@@ -27,7 +26,6 @@ class ParagraphModifier():
             if not paragraph_style.startswith("heading") and not paragraph_style.startswith("kop"):
                 kept_paragraphs.append(paragraph)
             else:
-                print("Removing paragraph: title or heading")
                 removed_paragraphs.append(paragraph)
 
         return kept_paragraphs, removed_paragraphs  
@@ -51,7 +49,6 @@ class ParagraphModifier():
             # Remove Titlepage
             # TODO: Use a more robust regex for detecting contactgegevens paragraphs (if they have a specific structure).
             if paragraph_style.startswith("title") or paragraph_style.startswith("contactgegevens") or paragraph.text.lower().startswith("ondergetekende"):
-                print("Removing paragraph: title or heading")
                 removed_paragraph_dict = {"text" : paragraph.text, "style" : paragraph.style.name}
                 removed_paragraphs.append(removed_paragraph_dict)
             else:
@@ -104,8 +101,7 @@ class ParagraphModifier():
         for i, paragraph in enumerate(paragraph_list): 
             paragraph_text: str = paragraph.text.lower()
             # TODO: Handle cases like "Figuur 2A", "Figuur/tabel romeinse cijfering", etc.
-            if re.match("^(figuur|tabel)\s[1-9](\.([1-9]|[1-9][1-9])(:|\.)|(:|\.)).*$", paragraph_text):
-                print("Removing table or figure")
+            if table_figure_pattern.match(paragraph_text):
                 removed_paragraph_dict = {"text" : paragraph.text , "style" : paragraph.style.name }
                 removed_paragraphs.append(removed_paragraph_dict)
             else:
@@ -1,3 +1,4 @@
+import functools
 import spacy
 import nltk
 from nltk.stem.snowball import SnowballStemmer
@@ -5,6 +6,11 @@ from spacy.lang.nl.examples import sentences
 from string import punctuation
 
 nlp = spacy.load("nl_core_news_lg")
+# Translation table is built once instead of on every (per word) call of `remove_punctuation`
+punctuation_table = str.maketrans('', '', punctuation)
+stemmer = SnowballStemmer("dutch")
+# Stemming a word always gives the same result and words repeat a lot, so the stems are memoized
+stem_word = functools.lru_cache(maxsize=2**16)(stemmer.stem)
 
 class TextModifier():
     @staticmethod
@@ -18,17 +24,37 @@ class TextModifier():
         Returns:
             str: The modified paragraph text after lemmatization.
         """
+        return TextModifier.apply_lemmatization_batch([paragraph_text])[0]
+
+    @staticmethod
+    def apply_lemmatization_batch(paragraph_texts: list[str]) -> list[str]:
+        """
+        Apply lemmatization to multiple paragraph texts at once.
+        The texts are streamed through spaCy in batches, which is considerably faster than processing them one by one.
+
+        Args:
+            paragraph_texts (list[str]): The paragraph texts.
+
+        Returns:
+            list[str]: The modified paragraph texts after lemmatization, in the same order as the input.
+        """
         # These puncts should be attached to the preceding word
         punct_list = ".!,;:]}\\/)?"
-        doc = nlp(paragraph_text)
-        modified_paragraph = ""
-        for word in doc:
-            # If word is punctuation, remove trailing whitespace if applicable
-            if word.lemma_ in punct_list:
-                modified_paragraph = modified_paragraph.rstrip()
-            modified_paragraph = modified_paragraph + word.lemma_ + " "
-        modified_paragraph = modified_paragraph.rstrip()
-        return modified_paragraph
+        modified_paragraphs: list[str] = []
+        # The parser and named entity recognizer are not needed for lemmatization
+        for doc in nlp.pipe(paragraph_texts, batch_size=64, disable=["parser", "ner"]):
+            # Collect the words in a list and join once, repeated string concatenation is quadratic
+            modified_words: list[str] = []
+            for word in doc:
+                # If word is punctuation, remove trailing whitespace if applicable
+                if word.lemma_ in punct_list:
+                    while modified_words and modified_words[-1].isspace():
+                        modified_words.pop()
+                    if modified_words:
+                        modified_words[-1] = modified_words[-1].rstrip()
+                modified_words.append(word.lemma_ + " ")
+            modified_paragraphs.append("".join(modified_words).rstrip())
+        return modified_paragraphs
 
     @staticmethod
     def apply_stemming(paragraph_text: str) -> str:
@@ -41,12 +67,7 @@ class TextModifier():
         Returns:
             str: The modified paragraph text after stemming.
         """
-        stemmer = SnowballStemmer("dutch")
-        modified_paragraph = ""
-        for word in paragraph_text.split():
-            modified_paragraph += stemmer.stem(word) + " "
-        modified_paragraph.rstrip()
-        return modified_paragraph
+        return " ".join(stem_word(word) for word in paragraph_text.split())
 
     @staticmethod
     def remove_stop_words(paragraph_text: str, stopwords) -> str:
@@ -55,7 +76,7 @@ class TextModifier():
 
         Args:
             paragraph_text (str): The paragraph text.
-            stopwords: The list of stop words to be removed.
+            stopwords: The collection of stop words to be removed, preferably a (frozen)set for fast lookups.
 
         Returns:
             str: The modified paragraph text after stop word removal.
@@ -85,4 +106,6 @@ class TextModifier():
         Returns:
             str: The modified paragraph text after punctuation removal.
         """
-        return paragraph_text.translate(str.maketrans('', '', punctuation))
+        if punctuation_list is punctuation:
+            return paragraph_text.translate(punctuation_table)
+        return paragraph_text.translate(str.maketrans('', '', "".join(punctuation_list)))
@@ -1,6 +1,12 @@
+from dataclasses import asdict, fields
 from data_classes.flag import FlagContainer, TextFlags, ParagraphFlags
 from data_classes.etl_pipelines import PipelineType
-import json
+
+CLEAR_SCREEN = '\n'*100
+PIPELINE_CHOICES = {"1": PipelineType.DEFAULT_DYNAMIC, "2": PipelineType.CUSTOM_DYNAMIC, "3": PipelineType.DEMO}
+YES_NO_ANSWERS = {"y": True, "n": False}
+# The flag schema is static, so the question for every flag can be generated once (e.g: "Do you want to remove stop words?")
+FLAG_QUESTIONS = {field.name: "Do you want to " + field.name.replace("_", " ") + "?" for field in fields(TextFlags) + fields(ParagraphFlags)}
 
 class PipelineConfigSystem:
     @staticmethod
@@ -12,19 +18,16 @@ class PipelineConfigSystem:
             PipelineType: The chosen ETL pipeline.
         """
         while True:
-            print('\n'*100)
+            print(CLEAR_SCREEN)
             print("--- Which ETL pipeline would you like to use? (1/2/3) ---")
             print("1.\t Dynamic ETL with default settings\n2.\t Dynamic ETL with custom settings\n3.\t Demo ETL")
-            match input("Pipeline: "):
-                case "1":
-                    print("Using default parameters for ETL...")
-                    return PipelineType.DEFAULT_DYNAMIC
-                case "2":
-                    return PipelineType.CUSTOM_DYNAMIC
-                case "3":
-                    return PipelineType.DEMO
-                case _:
-                    print("Invalid answer.")
+            chosen_pipeline = PIPELINE_CHOICES.get(input("Pipeline: "))
+            if chosen_pipeline is None:
+                print("Invalid answer.")
+                continue
+            if chosen_pipeline == PipelineType.DEFAULT_DYNAMIC:
+                print("Using default parameters for ETL...")
+            return chosen_pipeline
 
     @staticmethod
     def configure_flag(question: str) -> bool:
@@ -38,11 +41,10 @@ class PipelineConfigSystem:
             bool: True if the user answers 'yes', False if the user answers 'no'.
         """
         while True:
-            user_answer = input(question + " (y/n) ")
-            match user_answer.lower():
-                case "y": return True
-                case "n": return False
-                case _: print("Invalid answer. Please answer with 'y' or 'n'.")
+            user_answer = YES_NO_ANSWERS.get(input(question + " (y/n) ").lower())
+            if user_answer is not None:
+                return user_answer
+            print("Invalid answer. Please answer with 'y' or 'n'.")
 
     @staticmethod
     def configure_from_flags(flag_dict: dict) -> dict:
@@ -55,15 +57,11 @@ class PipelineConfigSystem:
         Returns:
             dict: The updated dictionary with the user-configured flag values.
         """
-        default_question = "Do you want to "
         for key in flag_dict:
             if key == "apply_lemmatization" and flag_dict["apply_stemming"]:
                 flag_dict[key] = False
                 continue
-            split_key = key.split("_")
-            cleaned_key = " ".join(split_key).rstrip()
-            specific_question = default_question + cleaned_key + "?"
-            flag_dict[key] = PipelineConfigSystem.configure_flag(specific_question)
+            flag_dict[key] = PipelineConfigSystem.configure_flag(FLAG_QUESTIONS[key])
         return flag_dict
 
     @staticmethod
@@ -77,19 +75,17 @@ class PipelineConfigSystem:
         Returns:
             FlagContainer: The updated flag container with user-configured flag values.
         """
-        print('\n'*100)
+        print(CLEAR_SCREEN)
         print('--- Define the parameters ---')
         # Create dictionary output so that we can access the keys (used for generating questions)
-        text_flags_json_str = json.dumps(flags.text_flags.__dict__)
-        text_flags_json_object = json.loads(text_flags_json_str)
-        text_flags_json_object = PipelineConfigSystem.configure_from_flags(text_flags_json_object)
-        para_flags_json_str = json.dumps(flags.paragraph_flags.__dict__)
-        para_flags_json_object = json.loads(para_flags_json_str)
-        para_flags_json_object = PipelineConfigSystem.configure_from_flags(para_flags_json_object)
+        text_flags_dict = asdict(flags.text_flags)
+        text_flags_dict = PipelineConfigSystem.configure_from_flags(text_flags_dict)
+        para_flags_dict = asdict(flags.paragraph_flags)
+        para_flags_dict = PipelineConfigSystem.configure_from_flags(para_flags_dict)
 
         # Transform dicts back to respective classes
-        updated_text_flags = TextFlags(**text_flags_json_object)
-        updated_para_flags = ParagraphFlags(**para_flags_json_object)
+        updated_text_flags = TextFlags(**text_flags_dict)
+        updated_para_flags = ParagraphFlags(**para_flags_dict)
         return FlagContainer(updated_para_flags, updated_text_flags)
 
     @staticmethod
@@ -0,0 +1,75 @@
+from etl_classes.dynamic_etl import DynamicETL
+from data_classes.flag import FlagContainer, ParagraphFlags, TextFlags
+from dataclasses import asdict
+import json
+import os
+import tempfile
+import unittest
+
+# `DynamicETL.__init__` executes the complete ETL, so only create the instance to call `_load` on
+dynamic_etl = DynamicETL.__new__(DynamicETL)
+config = asdict(FlagContainer(ParagraphFlags(), TextFlags()))
+
+def load_and_read(documents: list[dict]) -> dict:
+    with tempfile.TemporaryDirectory() as temp_dir:
+        dest_str = os.path.join(temp_dir, "corpora.json")
+        dynamic_etl._load(dest_str, {"config": config, "documents": (document for document in documents)})
+        with open(dest_str, "r", encoding="utf-8") as f:
+            return json.loads(f.read())
+
+class TestDynamicETLLoad(unittest.TestCase):
+    def test_load_no_documents(self):
+        # ARRANGE
+        documents = []
+
+        # ACT
+        result = load_and_read(documents)
+
+        # ASSERT
+        assert result == {"config": config, "documents": []}
+
+    def test_load_single_document(self):
+        # ARRANGE
+        documents = [
+            {"filename": "casus.docx", "corpora": [{"text": "De patiënt heeft pijn.", "style": "Normal"}]}
+        ]
+
+        # ACT
+        result = load_and_read(documents)
+
+        # ASSERT
+        assert result == {"config": config, "documents": documents}
+
+    def test_load_multiple_documents(self):
+        # ARRANGE
+        documents = [
+            {"filename": "casus_1.docx", "corpora": [{"text": "De patiënt heeft pijn.", "style": "Normal"}]},
+            {"filename": "casus_2.docx", "corpora": []},
+            {"filename": "casus_3.docx", "corpora": [
+                {"text": "Eerste alinea van de casus.", "style": "Normal"},
+                {"text": "Tweede alinea van de casus.", "style": "List Paragraph"}
+            ]}
+        ]
+
+        # ACT
+        result = load_and_read(documents)
+
+        # ASSERT
+        assert result == {"config": config, "documents": documents}
+
+    def test_load_failing_documents(self):
+        # ARRANGE
+        def failing_documents():
+            yield {"filename": "casus_1.docx", "corpora": []}
+            raise RuntimeError("Transformation failed")
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            dest_str = os.path.join(temp_dir, "corpora.json")
+
+            # ACT
+            with self.assertRaises(RuntimeError):
+                dynamic_etl._load(dest_str, {"config": config, "documents": failing_documents()})
+
+            # ASSERT
+            assert not os.path.exists(dest_str)
+            assert os.listdir(temp_dir) == []  # the temporary file is cleaned up as well
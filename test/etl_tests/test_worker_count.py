@@ -0,0 +1,47 @@
+from etl_classes.dynamic_etl import DynamicETL
+from unittest.mock import patch
+import os
+import unittest
+
+
+class TestWorkerCount(unittest.TestCase):
+    def test_worker_count_unset(self):
+        # ARRANGE
+        environment = {key: value for key, value in os.environ.items() if key != "ETL_WORKERS"}
+
+        # ACT
+        with patch.dict(os.environ, environment, clear=True):
+            worker_count = DynamicETL._get_worker_count()
+
+        # ASSERT
+        assert worker_count == max((os.cpu_count() or 1) - 1, 1)
+
+    def test_worker_count_zero(self):
+        # ACT
+        with patch.dict(os.environ, {"ETL_WORKERS": "0"}):
+            worker_count = DynamicETL._get_worker_count()
+
+        # ASSERT
+        assert worker_count == 1
+
+    def test_worker_count_negative(self):
+        # ACT
+        with patch.dict(os.environ, {"ETL_WORKERS": "-3"}):
+            worker_count = DynamicETL._get_worker_count()
+
+        # ASSERT
+        assert worker_count == 1
+
+    def test_worker_count_override(self):
+        # ACT
+        with patch.dict(os.environ, {"ETL_WORKERS": "4"}):
+            worker_count = DynamicETL._get_worker_count()
+
+        # ASSERT
+        assert worker_count == 4
+
+    def test_worker_count_not_an_integer(self):
+        # ACT & ASSERT
+        with patch.dict(os.environ, {"ETL_WORKERS": "x"}):
+            with self.assertRaises(ValueError):
+                DynamicETL._get_worker_count()
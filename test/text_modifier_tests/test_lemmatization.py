@@ -26,3 +26,25 @@ class TestLemmatization(unittest.TestCase):
         expected_output = ""
 
         assert lemmatized_text == expected_output
+
+
+    def test_lemmatize_batch(self):
+        # ARRANGE
+        source_strings = [
+            "Vanochtend ben ik vroeg opgestaan en heb ik een lekkere kop koffie gezet. Vervolgens heb ik mijn tanden gepoetst en ben ik naar buiten gegaan om een stuk te gaan hardlopen. Na het rennen heb ik gedoucht en me aangekleed.",
+            "",
+            "2023"
+        ]
+
+        # ACT
+        lemmatized_texts = TextModifier.apply_lemmatization_batch(source_strings)
+
+        # ASSERT
+        # Punctuation (e.g: "zetten.") must stay attached to the preceding word and the output order must match the input
+        expected_output = [
+            "vanochtend zijn ik vroeg opgestaan en hebben ik een lekker kop koffie zetten. vervolgens hebben ik mijn tand poetsen en zijn ik naar buiten gaan om een stuk te gaan hardlopen. na het rennen hebben ik douchen en me aangekleed.",
+            "",
+            "2023"
+        ]
+
+        assert lemmatized_texts == expected_output